@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 MESSAGES = {
     "en": {
         "welcome": "👋 {first_name}, welcome to our travel concierge. Please answer a few quick questions so we can craft your perfect trip.",
@@ -265,18 +267,28 @@ MESSAGES = {
     }
 }
 
-def get_text(lang_code: str, key: str, **kwargs) -> str:
-    """Get translated text"""
+@lru_cache(maxsize=4096)
+def _lookup_text(lang_code: str, key: str) -> str:
+    """Resolve the raw (unformatted) text for a language/key pair"""
+    messages = MESSAGES.get(lang_code, MESSAGES['en'])
+
     # If the key is a city name, get it from the cities dictionary
     if key in MESSAGES['en']['cities']:
-        return MESSAGES.get(lang_code, MESSAGES['en'])['cities'].get(key, key)
+        return messages['cities'].get(key, key)
     
     # Handle specific emoji keys that might not have direct translations for the text part
     if key.endswith("_emoji"):
-        return MESSAGES.get(lang_code, MESSAGES['en']).get(key, '') # Return emoji only
+        return messages.get(key, '') # Return emoji only
 
     # Retrieve the message string
-    message_string = MESSAGES.get(lang_code, MESSAGES['en']).get(key, key)
+    return messages.get(key, key)
+
+
+def get_text(lang_code: str, key: str, **kwargs) -> str:
+    """Get translated text"""
+    # Lookups are memoized per (lang_code, key); call _lookup_text.cache_clear()
+    # if MESSAGES is ever modified at runtime
+    message_string = _lookup_text(lang_code, key)
 
     # Only format if kwargs are provided and the message string actually has placeholders
     if kwargs:
@@ -1,26 +1,25 @@
 import os
 import asyncio
+from functools import lru_cache
 from aiogram import Bot, Dispatcher
 from aiogram.enums import ParseMode
 from aiogram.client.default import DefaultBotProperties
 from handlers.travel_handlers import router
 
 # Load token from environment variable or token.env file
+@lru_cache(maxsize=1)
 def load_token():
     # Try environment variable first
     token = os.getenv('BOT_TOKEN')
     
-    if not token:
+    if not token and os.path.exists('token.env'):
         # Try loading from token.env file
-        try:
-            with open('token.env', 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith('BOT_TOKEN'):
-                        token = line.split('=', 1)[1].strip().strip("'\"")
-                        break
-        except FileNotFoundError:
-            pass
+        with open('token.env', 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith('BOT_TOKEN'):
+                    token = line.split('=', 1)[1].strip().strip("'\"")
+                    break
     
     if not token:
         raise ValueError("BOT_TOKEN not found in environment variable or token.env file")